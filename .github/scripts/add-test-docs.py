@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+为测试函数补全文档注释
+
+扫描 Rust 测试文件，为缺少完整文档注释（测试目的/测试场景/预期结果）
+的 #[test] 函数插入标准格式的 /// 注释骨架，后续由开发者补充具体描述。
+
+标记位置通过一次全文 finditer 预先收集；每个测试函数只回溯紧贴
+#[test] 上方的连续 /// 注释块，再对三类标记各做一次二分查找，
+三项齐全才算已有完整注释，避免按函数数量重复切片扫描全文。
+
+使用方法:
+    python3 .github/scripts/add-test-docs.py <测试文件路径>
+"""
+
+import os
+import re
+import sys
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List
+
+# 匹配 #[test] 属性及紧随其后的测试函数声明
+TEST_RE = re.compile(r"^(?P<indent>[ \t]*)#\[test\]\n(?P=indent)fn (?P<name>\w+)", re.MULTILINE)
+
+# 完整文档注释的标记，三项齐全才算完整
+MARKER_RE = re.compile(r"///.*?(?P<marker>测试目的|测试场景|预期结果)")
+
+MARKER_NAMES = ("测试目的", "测试场景", "预期结果")
+
+
+def _doc_block_start(content: str, pos: int) -> int:
+    """返回紧贴 pos（#[test] 行首）上方连续 /// 注释块的起始偏移
+
+    逐行向上回溯，遇到第一个非 /// 行即停；没有注释块时返回 pos。
+    """
+    start = pos
+    while start > 0:
+        line_start = content.rfind("\n", 0, start - 1) + 1
+        if not content[line_start:start].lstrip().startswith("///"):
+            break
+        start = line_start
+    return start
+
+
+def build_doc_comment(test_name: str, indent: str) -> str:
+    """根据测试函数名生成文档注释骨架"""
+    summary = test_name.removeprefix("test_").replace("_", " ")
+    return (
+        f"{indent}/// 测试目的：验证 {summary} 的行为\n"
+        f"{indent}/// 测试场景：执行 {summary} 相关操作\n"
+        f"{indent}/// 预期结果：行为符合预期，无错误发生\n"
+    )
+
+
+def add_docs_to_file(path: Path) -> int:
+    """为单个文件中缺少完整注释的测试函数插入注释骨架
+
+    返回实际更新的测试函数数量。
+    """
+    content = path.read_text(encoding="utf-8")
+
+    # 一次性按标记类别收集位置（finditer 天然有序），
+    # 之后每个测试函数对每类标记只需一次二分查找
+    marker_positions = {name: [] for name in MARKER_NAMES}
+    for m in MARKER_RE.finditer(content):
+        marker_positions[m.group("marker")].append(m.start())
+
+    def has_full_doc_comment(pos: int) -> bool:
+        # 只认紧贴 #[test] 上方的连续 /// 块，且三类标记都要出现，
+        # 避免把邻近测试的注释误判成自己的
+        block_start = _doc_block_start(content, pos)
+        if block_start == pos:
+            return False
+        for positions in marker_positions.values():
+            i = bisect_left(positions, block_start)
+            if i == len(positions) or positions[i] >= pos:
+                return False
+        return True
+
+    # 收集 (插入位置, 注释内容) 后单趟拼接输出，
+    # 避免每处插入都整体重建一次字符串（O(K·N) → O(N)）
+    edits = [
+        (m.start(), build_doc_comment(m.group("name"), m.group("indent")))
+        for m in TEST_RE.finditer(content)
+        if not has_full_doc_comment(m.start())
+    ]
+
+    if edits:
+        pieces: List[str] = []
+        cursor = 0
+        for pos, doc in edits:
+            pieces.append(content[cursor:pos])
+            pieces.append(doc)
+            cursor = pos
+        pieces.append(content[cursor:])
+        path.write_text("".join(pieces), encoding="utf-8")
+    return len(edits)
+
+
+def main() -> int:
+    if len(sys.argv) < 2:
+        print(f"用法: {sys.argv[0]} <测试文件或目录>...")
+        return 1
+
+    paths: List[Path] = []
+    for arg in sys.argv[1:]:
+        p = Path(arg)
+        if p.is_dir():
+            paths.extend(sorted(p.rglob("*.rs")))
+        elif p.exists():
+            paths.append(p)
+        else:
+            print(f"❌ 文件不存在: {p}")
+            return 1
+
+    # 各文件相互独立，多文件时用进程池并行处理，
+    # 把解释器启动成本摊薄到整批文件上
+    if len(paths) == 1:
+        total = add_docs_to_file(paths[0])
+    else:
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            total = sum(executor.map(add_docs_to_file, paths))
+
+    print(f"总共更新了 {total} 个测试函数的文档注释")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+分析测试性能回归
+
+对比当前运行与基线的用例耗时，找出耗时变化超过阈值的用例，
+生成 Markdown 性能回归报告。
+
+使用方法:
+    python3 .github/scripts/analyze-performance-regression.py \\
+        --current metrics/current.json --baseline metrics/baseline.json \\
+        --output perf-report.md
+"""
+
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict
+
+# orjson 是 C 实现的 JSON 解析器；未安装时回退到内置 json。
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# 耗时变化超过该百分比才视为回归/改善
+THRESHOLD_PCT = 10.0
+
+# 两种空报告场景各用各的结论：缺基线 ≠ 对比后无显著变化
+NO_BASELINE_REPORT = "# Performance Regression Report\n\nNo baseline comparison available.\n"
+NO_CHANGE_REPORT = "# Performance Regression Report\n\nNo significant changes vs baseline.\n"
+
+
+def load_performance_data(metrics_file: Path) -> Dict[str, Any]:
+    """加载度量文件并建立 用例名 -> 耗时 的索引"""
+    data = _loads(metrics_file.read_bytes())
+    cases = data.get("test_cases", [])
+    if cases and not isinstance(cases[0], dict):
+        # 新格式：(name, module, status, duration_secs) 定长记录
+        tests = {t[0]: t[3] for t in cases}
+    else:
+        # 旧格式：每条用例是 4 键字典
+        tests = {t.get("name", ""): t.get("duration_secs", 0.0) for t in cases}
+    return {
+        "summary": data.get("summary", {}),
+        "tests": tests,
+        "timestamp": data.get("timestamp", ""),
+    }
+
+
+def compare_performance(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold_pct: float = THRESHOLD_PCT
+) -> Dict[str, Any]:
+    """对比当前与基线的用例耗时"""
+    current_tests = current["tests"]
+    baseline_tests = baseline["tests"]
+
+    test_changes: Dict[str, Dict[str, float]] = {}
+    # 按键集合拆成不相交的三类，公共用例直接下标访问，不再需要
+    # .get 兜底；只在当前出现的用例基线为 0，本来就会被过滤，
+    # 整类直接跳过。阈值判断用乘法（|diff| > 比例 * 基线），
+    # 除法只在越过阈值的少数用例上做一次
+    ck = current_tests.keys()
+    bk = baseline_tests.keys()
+    threshold_ratio = threshold_pct / 100.0
+    for name in ck & bk:
+        baseline_dur = baseline_tests[name]
+        if baseline_dur > 0:
+            test_diff = current_tests[name] - baseline_dur
+            if abs(test_diff) > threshold_ratio * baseline_dur:
+                test_changes[name] = {
+                    "current": current_tests[name],
+                    "baseline": baseline_dur,
+                    "diff_percent": test_diff / baseline_dur * 100.0,
+                }
+    # 只在基线中出现的用例相当于当前耗时为 0，按 -100% 记录
+    if threshold_ratio < 1.0:
+        for name in bk - ck:
+            baseline_dur = baseline_tests[name]
+            if baseline_dur > 0:
+                test_changes[name] = {
+                    "current": 0.0,
+                    "baseline": baseline_dur,
+                    "diff_percent": -100.0,
+                }
+
+    cur_total = current["summary"].get("duration_secs", 0.0)
+    base_total = baseline["summary"].get("duration_secs", 0.0)
+    diff_percent = (cur_total - base_total) / base_total * 100.0 if base_total > 0 else 0.0
+    return {
+        "overall": {"current": cur_total, "baseline": base_total, "diff_percent": diff_percent},
+        "test_changes": test_changes,
+    }
+
+
+def generate_performance_report(
+    comparison: Dict[str, Any], output: Path, timestamp: str
+) -> None:
+    """生成 Markdown 性能回归报告（时间戳由调用方传入）"""
+    # 完全没有变化时（首跑自比较）写一行结论，跳过整套表格构建
+    if not comparison["test_changes"] and comparison["overall"]["diff_percent"] == 0.0:
+        output.write_text(NO_CHANGE_REPORT, encoding="utf-8")
+        print(f"✅ 性能报告已生成: {output}")
+        return
+
+    report_lines = []
+    # append 绑定为局部名，表格行循环里省掉每次的属性查找
+    _append = report_lines.append
+    _append("# Performance Regression Report")
+    _append("")
+    _append(f"**Generated**: {timestamp}")
+    _append("")
+
+    overall = comparison["overall"]
+    _append("## 整体耗时")
+    _append("")
+    _append(
+        f"当前 {overall['current']:.2f}s / 基线 {overall['baseline']:.2f}s "
+        f"({overall['diff_percent']:+.2f}%)"
+    )
+    _append("")
+
+    test_changes = comparison["test_changes"]
+    if test_changes:
+        _append("## 耗时变化明显的用例")
+        _append("")
+        _append("| 用例 | 当前 | 基线 | 变化 |")
+        _append("|------|------|------|------|")
+        sorted_changes = sorted(
+            test_changes.items(), key=lambda x: x[1]["diff_percent"], reverse=True
+        )
+        for test_name, change in sorted_changes:
+            _append(
+                f"| `{test_name}` | {change['current']:.3f}s | {change['baseline']:.3f}s "
+                f"| {change['diff_percent']:+.2f}% |"
+            )
+    else:
+        _append("没有用例的耗时变化超过阈值。")
+    _append("")
+
+    # 直接写编码后的字节，跳过 write_text 的文本层编码路径
+    output.write_bytes("\n".join(report_lines).encode("utf-8"))
+    print(f"✅ 性能报告已生成: {output}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="分析测试性能回归")
+    parser.add_argument("--current", type=Path, required=True, help="当前度量文件")
+    parser.add_argument("--baseline", type=Path, required=True, help="基线度量文件")
+    parser.add_argument("--output", type=Path, required=True, help="输出报告路径")
+    args = parser.parse_args()
+
+    if not args.current.exists():
+        print(f"❌ 文件不存在: {args.current}")
+        return 1
+
+    if not args.baseline.exists():
+        # 没有基线时对比结果必然为空，连 compare_performance 都不用跑
+        print("ℹ️  基线文件不存在，跳过对比")
+        args.output.write_text(NO_BASELINE_REPORT, encoding="utf-8")
+        print(f"✅ 性能报告已生成: {args.output}")
+        return 0
+
+    current = load_performance_data(args.current)
+    baseline = load_performance_data(args.baseline)
+    comparison = compare_performance(current, baseline)
+    generate_performance_report(comparison, args.output, datetime.now().isoformat())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
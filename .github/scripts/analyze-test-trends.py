@@ -0,0 +1,457 @@
+#!/usr/bin/env python3
+"""
+分析测试历史趋势
+
+加载 collect-test-metrics.py 产出的历史度量文件，分析失败率、
+用例稳定性与耗时趋势，生成 Markdown 趋势报告。
+
+使用方法:
+    python3 .github/scripts/analyze-test-trends.py \\
+        --metrics-dir metrics/ --output trend-report.md
+"""
+
+import argparse
+import json
+import mmap
+import os
+import pickle
+import sys
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# orjson 是 C 实现的 JSON 解析器，历史文件很多时解析是主要成本；
+# 未安装时回退到内置 json。orjson 只接受 bytes/bytearray/
+# memoryview/str，mmap 映射要包一层 memoryview（零拷贝）才能解析。
+try:
+    from orjson import loads as _loads
+
+    _HAS_ORJSON = True
+except ImportError:
+    from json import loads as _loads
+
+    _HAS_ORJSON = False
+
+# 小于该大小（字节）的文件直接 read()，mmap 的建立成本不划算
+MMAP_THRESHOLD = 64 * 1024
+
+# 失败率超过该值（%）的用例视为不稳定
+UNSTABLE_THRESHOLD = 10.0
+
+# 历史度量解析结果的缓存文件名（放在度量目录内）
+CACHE_NAME = ".trend-cache-v1.pkl"
+
+# 文件名 -> 时间戳的旁路索引，为文件名不含时间戳的度量文件
+# 提供 --since/--until 预过滤能力
+INDEX_NAME = ".trend-index.json"
+
+# collect-test-metrics.py 追加维护的时序文件名索引
+LIST_NAME = ".index"
+
+
+class _FileRef:
+    """索引分支里代替 os.DirEntry 的轻量文件引用"""
+
+    __slots__ = ("name", "path")
+
+    def __init__(self, name: str, path: str) -> None:
+        self.name = name
+        self.path = path
+
+    def stat(self) -> os.stat_result:
+        return os.stat(self.path)
+
+
+def _timestamp_from_name(name: str) -> Optional[datetime]:
+    """从文件名解析时间戳，解析不了返回 None
+
+    collect-test-metrics.py 的输出按 ISO 时间命名，时间部分的
+    冒号被替换成 '-'（如 2024-11-15T12-00-00.json）。
+    """
+    stem = name[:-5]  # 去掉 .json 后缀
+    if "T" in stem:
+        date_part, _, time_part = stem.partition("T")
+        stem = f"{date_part}T{time_part.replace('-', ':')}"
+    try:
+        return datetime.fromisoformat(stem)
+    except ValueError:
+        return None
+
+
+def _load_index(metrics_dir: Path) -> Dict[str, str]:
+    """读取旁路时间戳索引，不存在或损坏时返回空索引"""
+    try:
+        return _loads((metrics_dir / INDEX_NAME).read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def _filter_by_time(
+    metrics_dir: Path,
+    entries: List[Any],
+    since: Optional[datetime],
+    until: Optional[datetime],
+) -> List[Any]:
+    """按时间窗口预过滤度量文件，范围外的文件完全不解析
+
+    优先从文件名 O(1) 解析时间戳；文件名不含时间戳的文件查询
+    旁路索引；两处都查不到的保守保留（解析后会补进索引）。
+    """
+    index: Optional[Dict[str, str]] = None
+    kept = []
+    for e in entries:
+        ts = _timestamp_from_name(e.name)
+        if ts is None:
+            if index is None:
+                index = _load_index(metrics_dir)
+            raw = index.get(e.name)
+            if raw:
+                try:
+                    ts = datetime.fromisoformat(raw)
+                except ValueError:
+                    ts = None
+        if ts is not None:
+            if since is not None and ts < since:
+                continue
+            if until is not None and ts > until:
+                continue
+        kept.append(e)
+    return kept
+
+
+def _load_one(path: str) -> Any:
+    """解析单个度量文件，失败时告警并返回 None
+
+    collect-test-metrics.py 会在 JSON 旁边写出 pickle 二进制摘要
+    （.bin）；摘要不落后于 JSON 时优先加载它，跳过整个 JSON 解析。
+    """
+    bin_path = path[:-5] + ".bin"
+    try:
+        if os.path.getmtime(bin_path) >= os.path.getmtime(path):
+            with open(bin_path, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError):
+        pass
+    try:
+        with open(path, "rb") as f:
+            # 大文件让 orjson 直接在 mmap 映射上解析，省掉一次
+            # 内核到用户态的整文件拷贝，页面与 page cache 共享
+            if _HAS_ORJSON and os.fstat(f.fileno()).st_size >= MMAP_THRESHOLD:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    # orjson 不认 mmap 对象本身，包一层 memoryview
+                    # （零拷贝）；解析完先释放视图再关闭映射
+                    mv = memoryview(mm)
+                    try:
+                        return _loads(mv)
+                    finally:
+                        mv.release()
+            return _loads(f.read())
+    except (ValueError, OSError) as e:
+        print(f"⚠️  跳过无法解析的文件 {os.path.basename(path)}: {e}", file=sys.stderr)
+        return None
+
+
+def load_historical_metrics(
+    metrics_dir: Path,
+    jobs: int = 0,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> List[Dict[str, Any]]:
+    """按时间顺序加载目录下的历史度量文件
+
+    指定 --since/--until 时先按时间窗口预过滤，范围外的文件
+    既不 stat 也不解析，运行时间与窗口大小成正比。
+
+    历史文件一经写入便不可变，因此按 (文件名, mtime_ns, 大小) 做
+    pickle 缓存：命中的文件直接反序列化，热运行只需解析新增文件。
+    缓存里已不存在于磁盘的条目会在保存时被剔除。
+
+    缓存未命中的文件用线程池并行读取/解析（磁盘 IO 相互独立，
+    orjson 解析时会释放 GIL），ex.map 保证结果仍按文件名有序。
+    """
+    cache_path = metrics_dir / CACHE_NAME
+    cache: Dict[str, Any] = {}
+    if cache_path.exists():
+        try:
+            cache = pickle.loads(cache_path.read_bytes())
+        except Exception:
+            cache = {}
+
+    list_path = metrics_dir / LIST_NAME
+    if list_path.exists():
+        # 时序索引已按写入顺序记录文件名，既免去目录扫描，
+        # 也免去每次 O(N log N) 的排序；缺失的文件直接跳过
+        seen = set()
+        entries: List[Any] = []
+        for line in list_path.read_text(encoding="utf-8").splitlines():
+            name = line.strip()
+            if name and name not in seen:
+                seen.add(name)
+                path = os.path.join(metrics_dir, name)
+                if os.path.isfile(path):
+                    entries.append(_FileRef(name, path))
+    else:
+        # os.scandir 的 DirEntry 自带目录读取时的 stat 信息，
+        # 相比 glob + 逐文件 stat 每个文件少一次系统调用。
+        # 点号开头的是 .trend-index.json 等辅助文件，不是度量数据
+        entries = [
+            e
+            for e in os.scandir(metrics_dir)
+            if e.name.endswith(".json") and not e.name.startswith(".") and e.is_file()
+        ]
+        entries.sort(key=lambda e: e.name)
+
+    windowed = since is not None or until is not None
+    if windowed:
+        entries = _filter_by_time(metrics_dir, entries, since, until)
+
+    stats = [e.stat() for e in entries]
+
+    # 先按缓存分出命中与未命中，占位列表保持时间顺序
+    slots: List[Any] = [None] * len(entries)
+    fresh_cache: Dict[str, Any] = {}
+    to_parse: List[int] = []
+    for i, (metrics_file, st) in enumerate(zip(entries, stats)):
+        entry = cache.get(metrics_file.name)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            fresh_cache[metrics_file.name] = entry
+            slots[i] = entry[2]
+        else:
+            to_parse.append(i)
+
+    dirty = False
+    if to_parse:
+        workers = jobs or min(32, (os.cpu_count() or 1) * 4)
+        if len(to_parse) == 1 or workers == 1:
+            parsed = [_load_one(entries[i].path) for i in to_parse]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                parsed = list(executor.map(_load_one, (entries[i].path for i in to_parse)))
+        for i, data in zip(to_parse, parsed):
+            if data is None:
+                continue
+            st = stats[i]
+            fresh_cache[entries[i].name] = (st.st_mtime_ns, st.st_size, data)
+            slots[i] = data
+            dirty = True
+
+        # 文件名不含时间戳的新解析文件记入旁路索引，
+        # 下次运行的 --since/--until 预过滤即可覆盖它们
+        index_updates = {
+            entries[i].name: data["timestamp"]
+            for i, data in zip(to_parse, parsed)
+            if data is not None
+            and data.get("timestamp")
+            and _timestamp_from_name(entries[i].name) is None
+        }
+        if index_updates:
+            index = _load_index(metrics_dir)
+            index.update(index_updates)
+            try:
+                (metrics_dir / INDEX_NAME).write_text(json.dumps(index), encoding="utf-8")
+            except OSError:
+                pass
+
+    if windowed:
+        # 窗口过滤只看到部分文件，增量合并缓存，不剔除窗口外的条目
+        if dirty:
+            try:
+                cache_path.write_bytes(
+                    pickle.dumps({**cache, **fresh_cache}, protocol=pickle.HIGHEST_PROTOCOL)
+                )
+            except OSError:
+                pass
+    # 有新增/变化或有条目被剔除时才回写缓存
+    elif dirty or len(fresh_cache) != len(cache):
+        try:
+            cache_path.write_bytes(pickle.dumps(fresh_cache, protocol=pickle.HIGHEST_PROTOCOL))
+        except OSError:
+            pass
+    return [m for m in slots if m is not None]
+
+
+def analyze_all(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """单趟遍历同时完成失败率、稳定性与耗时三类聚合
+
+    三类分析原本各自遍历整份 metrics（内层还要各自走一遍
+    test_cases），融合成一个外层循环后，每条用例记录只被触碰一次，
+    解释器开销和内存流量都降到原来的约三分之一。
+    """
+    fr_overall: List[Dict[str, Any]] = []
+    fr_by_module: Dict[str, List[float]] = defaultdict(list)
+    test_runs: Counter = Counter()
+    test_failures: Counter = Counter()
+    dur_overall: List[Dict[str, Any]] = []
+    dur_by_test: Dict[str, List[float]] = defaultdict(list)
+
+    for m in metrics:
+        summary = m.get("summary", {})
+        timestamp = m.get("timestamp", "")
+        total = summary.get("total", 0)
+        failed = summary.get("failed", 0)
+        fr_overall.append(
+            {
+                "timestamp": timestamp,
+                "failure_rate": failed / total * 100.0 if total else 0.0,
+            }
+        )
+        dur_overall.append(
+            {"timestamp": timestamp, "duration_secs": summary.get("duration_secs", 0.0)}
+        )
+
+        for module, stats in m.get("module_stats", {}).items():
+            mod_total = stats.get("total", 0)
+            mod_failed = stats.get("failed", 0)
+            fr_by_module[module].append(mod_failed / mod_total * 100.0 if mod_total else 0.0)
+
+        # 用例名跨运行大量重复，intern 后计数字典共享键存储，
+        # 哈希与相等比较都更快；Counter.update 的批量累加在 C 层
+        # 完成，省掉每条用例的 Python 级字典自增
+        cases = m.get("test_cases", [])
+        if cases and not isinstance(cases[0], dict):
+            # 新格式：(name, module, status, duration_secs) 定长记录，
+            # 按位置访问，单条记录内存约为字典的四分之一
+            names = [sys.intern(t[0]) for t in cases]
+            test_runs.update(names)
+            test_failures.update(name for name, t in zip(names, cases) if t[2] == "Failed")
+            for name, t in zip(names, cases):
+                dur_by_test[name].append(t[3])
+        else:
+            # 旧格式：每条用例是 4 键字典
+            names = [sys.intern(t.get("name", "")) for t in cases]
+            test_runs.update(names)
+            test_failures.update(
+                name for name, t in zip(names, cases) if t.get("status") == "Failed"
+            )
+            for name, t in zip(names, cases):
+                dur_by_test[name].append(t.get("duration_secs", 0.0))
+
+    unstable_tests = [
+        {
+            "name": name,
+            "runs": runs,
+            "failures": test_failures[name],
+            "failure_rate": test_failures[name] / runs * 100.0,
+        }
+        for name, runs in test_runs.items()
+        if runs and test_failures[name] / runs * 100.0 > UNSTABLE_THRESHOLD
+    ]
+    unstable_tests.sort(key=lambda x: x["failure_rate"], reverse=True)
+
+    return {
+        "failure_rate": {"overall": fr_overall, "by_module": dict(fr_by_module)},
+        "stability": {"unstable_tests": unstable_tests, "total_tracked": len(test_runs)},
+        "duration": {"overall": dur_overall, "by_test": dict(dur_by_test)},
+    }
+
+
+def analyze_failure_rate_trend(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """分析整体及模块级失败率趋势（analyze_all 的薄封装）"""
+    return analyze_all(metrics)["failure_rate"]
+
+
+def analyze_stability(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """统计每个用例的运行/失败次数（analyze_all 的薄封装）"""
+    return analyze_all(metrics)["stability"]
+
+
+def analyze_duration_trend(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """分析整体与单个用例的耗时趋势（analyze_all 的薄封装）"""
+    return analyze_all(metrics)["duration"]
+
+
+def generate_trend_report(
+    failure_rate: Dict[str, Any],
+    stability: Dict[str, Any],
+    duration: Dict[str, Any],
+    output: Path,
+    timestamp: str,
+) -> None:
+    """生成 Markdown 趋势报告（时间戳由调用方传入）
+
+    逐段写入大缓冲的文件句柄，不在内存中拼接整份报告，
+    峰值内存与报告大小无关。
+    """
+    with output.open("w", encoding="utf-8", buffering=1 << 20) as f:
+        w = f.write
+        w("# Test Trends Report\n\n")
+        w(f"**Generated**: {timestamp}\n\n")
+
+        overall = failure_rate["overall"]
+        w("## 失败率趋势\n\n")
+        if overall:
+            latest = overall[-1]
+            avg = sum(p["failure_rate"] for p in overall) / len(overall)
+            w(f"- 最近一次失败率: {latest['failure_rate']:.2f}%\n")
+            w(f"- 历史平均失败率: {avg:.2f}% (共 {len(overall)} 次运行)\n")
+        else:
+            w("暂无历史数据。\n")
+        w("\n")
+
+        w("## 不稳定用例\n\n")
+        unstable = stability["unstable_tests"]
+        if unstable:
+            w("| 用例 | 运行次数 | 失败次数 | 失败率 |\n")
+            w("|------|---------|---------|--------|\n")
+            # writelines 直接消费生成器，表格行边生成边落入写缓冲
+            f.writelines(
+                f"| `{t['name']}` | {t['runs']} | {t['failures']} | {t['failure_rate']:.2f}% |\n"
+                for t in unstable[:10]
+            )
+        else:
+            w(f"全部 {stability['total_tracked']} 个用例运行稳定。\n")
+        w("\n")
+
+        w("## 耗时趋势\n\n")
+        durations = duration["overall"]
+        if durations:
+            latest = durations[-1]
+            avg = sum(p["duration_secs"] for p in durations) / len(durations)
+            w(f"- 最近一次总耗时: {latest['duration_secs']:.2f}s\n")
+            w(f"- 历史平均总耗时: {avg:.2f}s\n")
+        else:
+            w("暂无历史数据。\n")
+        w("\n")
+
+    print(f"✅ 趋势报告已生成: {output}")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="分析测试历史趋势")
+    parser.add_argument("--metrics-dir", type=Path, required=True, help="历史度量文件目录")
+    parser.add_argument("--output", type=Path, required=True, help="输出报告路径")
+    parser.add_argument("--jobs", type=int, default=0, help="并行解析的线程数（默认按 CPU 推算）")
+    parser.add_argument(
+        "--since", type=datetime.fromisoformat, default=None, help="只分析此时间之后的度量（ISO 格式）"
+    )
+    parser.add_argument(
+        "--until", type=datetime.fromisoformat, default=None, help="只分析此时间之前的度量（ISO 格式）"
+    )
+    args = parser.parse_args()
+
+    if not args.metrics_dir.is_dir():
+        print(f"❌ 目录不存在: {args.metrics_dir}")
+        return 1
+
+    metrics = load_historical_metrics(
+        args.metrics_dir, jobs=args.jobs, since=args.since, until=args.until
+    )
+    if not metrics:
+        print("ℹ️  没有可分析的历史度量数据")
+        return 0
+
+    analyses = analyze_all(metrics)
+    generate_trend_report(
+        analyses["failure_rate"],
+        analyses["stability"],
+        analyses["duration"],
+        args.output,
+        datetime.now().isoformat(),
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
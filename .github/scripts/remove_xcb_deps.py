@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+从 Cargo.lock 中移除 XCB 相关依赖
+
+部分 CI 环境（如 ARM64 Linux）缺少 XCB 系统库，构建前需要把剪贴板
+相关的可选依赖从 Cargo.lock 中剔除，避免 cargo 校验失败。
+
+使用 Python 3.11 内置的 tomllib 一次性解析整个文件，在解析后的
+数据结构上过滤 package 数组，再重新序列化为 Cargo.lock 格式。
+相比逐行扫描 + 手写括号深度状态机，整体只需一次 O(n) 解析。
+
+使用方法:
+    python3 .github/scripts/remove_xcb_deps.py [Cargo.lock 路径]
+"""
+
+import mmap
+import os
+import sys
+import traceback
+from pathlib import Path
+from typing import Any, Dict, Tuple
+
+# rtoml 是 Rust 实现的 TOML 解析器，大文件上明显快于纯 Python 的
+# tomllib；CI 镜像未安装时回退到内置实现，行为完全一致。
+try:
+    from rtoml import loads as _toml_loads
+except ImportError:
+    from tomllib import loads as _toml_loads
+
+# 需要移除的 XCB 相关包（不可变常量，成员检查为 O(1)）
+PACKAGES_TO_REMOVE: frozenset[str] = frozenset({
+    "clipboard",
+    "x11-clipboard",
+    "xcb",
+    "clipboard-win",
+})
+
+
+def remove_packages_from_cargo_lock(content: str) -> Tuple[str, Dict[str, int]]:
+    """解析 Cargo.lock 并移除目标包及其依赖引用
+
+    依赖项的格式为 "name" 或 "name version (source)"，
+    取第一个空格前的部分即为包名。
+
+    过滤的同时累计统计信息，返回 (序列化结果, 统计计数)，
+    校验只需对计数做整数比较，无需再次扫描整个文件。
+    """
+    data = _toml_loads(content)
+
+    packages = data.get("package", [])
+    kept = []
+    named = 0
+    removed_deps = 0
+    for package in packages:
+        if package.get("name") in PACKAGES_TO_REMOVE:
+            continue
+        if "name" in package:
+            named += 1
+        deps = package.get("dependencies")
+        if deps:
+            filtered = [d for d in deps if d.split(" ", 1)[0] not in PACKAGES_TO_REMOVE]
+            removed_deps += len(deps) - len(filtered)
+            package["dependencies"] = filtered
+        kept.append(package)
+
+    data["package"] = kept
+    stats = {
+        "total": len(packages),
+        "kept": len(kept),
+        "named": named,
+        "removed_packages": len(packages) - len(kept),
+        "removed_deps": removed_deps,
+    }
+    return serialize_cargo_lock(data), stats
+
+
+def serialize_cargo_lock(data: Dict[str, Any]) -> str:
+    """把解析后的数据重新序列化为 Cargo.lock 格式
+
+    Cargo.lock 的结构固定（version 头 + [[package]] 数组 + 可选的
+    [metadata] 表），这里按 cargo 自身的输出格式手工序列化，
+    避免 CI 镜像额外安装 TOML 写入库。
+    """
+    lines = [
+        "# This file is automatically @generated by Cargo.",
+        "# It is not intended for manual editing.",
+    ]
+    if "version" in data:
+        lines.append(f'version = {data["version"]}')
+
+    for package in data.get("package", []):
+        lines.append("")
+        lines.append("[[package]]")
+        for key in ("name", "version", "source", "checksum"):
+            if key in package:
+                lines.append(f'{key} = "{package[key]}"')
+        deps = package.get("dependencies")
+        if deps:
+            lines.append("dependencies = [")
+            for dep in deps:
+                lines.append(f' "{dep}",')
+            lines.append("]")
+
+    metadata = data.get("metadata")
+    if metadata:
+        lines.append("")
+        lines.append("[metadata]")
+        for key, value in metadata.items():
+            lines.append(f'"{key}" = "{value}"')
+
+    lines.append("")
+    return "\n".join(lines)
+
+
+def validate_cargo_lock(stats: Dict[str, int]) -> bool:
+    """根据过滤阶段累计的计数校验处理结果
+
+    目标包在过滤时就被剔除，这里只需确认计数自洽：
+    保留的包都有 name 字段，且保留数 + 移除数等于总数。
+    """
+    if stats["kept"] != stats["named"]:
+        print(f"❌ 校验失败: 保留的 {stats['kept']} 个包中只有 {stats['named']} 个有 name 字段")
+        return False
+
+    if stats["kept"] + stats["removed_packages"] != stats["total"]:
+        print(
+            f"❌ 校验失败: 保留 ({stats['kept']}) + 移除 ({stats['removed_packages']}) "
+            f"与总数 ({stats['total']}) 不一致"
+        )
+        return False
+
+    print(
+        f"✅ 校验通过: 保留 {stats['kept']} 个包，"
+        f"移除 {stats['removed_packages']} 个包 / {stats['removed_deps']} 条依赖引用"
+    )
+    return True
+
+
+def main() -> int:
+    lock_path = Path(sys.argv[1]) if len(sys.argv) > 1 else Path("Cargo.lock")
+
+    if not lock_path.exists():
+        print(f"❌ 文件不存在: {lock_path}")
+        return 1
+
+    try:
+        # 在 mmap 的字节视图上做目标包探测：常见的"无目标包"分支
+        # 只付出几次 C 级子串搜索，完全不需要把文件解码成 str；
+        # 确认需要处理后才解码一次
+        with open(lock_path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                if all(
+                    mm.find(b'"%s"' % name.encode()) == -1 for name in PACKAGES_TO_REMOVE
+                ):
+                    print("ℹ️  未发现目标包，无需修改")
+                    return 0
+                original_content = mm[:].decode("utf-8")
+            finally:
+                mm.close()
+
+        modified_content, stats = remove_packages_from_cargo_lock(original_content)
+
+        if not validate_cargo_lock(stats):
+            return 1
+
+        # 内容没有变化时不落盘，保住 mtime，让下游 cargo 缓存继续有效
+        if modified_content == original_content:
+            print("ℹ️  内容无变化，跳过写入")
+            return 0
+
+        # 先写临时文件再原子替换，进程中途挂掉也不会留下截断的 Cargo.lock
+        tmp_path = lock_path.with_suffix(lock_path.suffix + ".tmp")
+        tmp_path.write_text(modified_content, encoding="utf-8")
+        os.replace(tmp_path, lock_path)
+        print(f"✅ 已更新 {lock_path}")
+        return 0
+    except Exception as e:
+        print(f"❌ 处理失败: {e}")
+        if os.environ.get("DEBUG"):
+            traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
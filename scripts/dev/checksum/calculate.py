@@ -0,0 +1,42 @@
+"""计算文件的 SHA-256 校验和
+
+发布流程中用于计算 release 压缩包的校验和，结果写入
+Homebrew Formula 的 sha256 字段。
+"""
+
+import hashlib
+from pathlib import Path
+
+from utils.logger import log_error, log_success
+
+# 每次读取 1 MiB：release 压缩包有几十 MB，大块读取把时间花在
+# 哈希计算而不是系统调用上
+CHUNK_SIZE = 1 << 20
+
+# Python 3.11+ 提供 hashlib.file_digest，整个读取-哈希循环在 C 层
+# 完成；旧版本回退到分块循环
+_file_digest = getattr(hashlib, "file_digest", None)
+
+
+def calculate(file_path: str) -> str:
+    """分块读取文件并计算 SHA-256"""
+    with open(file_path, "rb") as f:
+        if _file_digest is not None:
+            return _file_digest(f, "sha256").hexdigest()
+        sha256_hash = hashlib.sha256()
+        for chunk in iter(lambda: f.read(CHUNK_SIZE), b""):
+            sha256_hash.update(chunk)
+        return sha256_hash.hexdigest()
+
+
+def run(args) -> int:
+    """checksum 子命令入口"""
+    path = Path(args.file)
+    if not path.exists():
+        log_error(f"文件不存在: {path}")
+        return 1
+
+    digest = calculate(str(path))
+    log_success(f"{path.name}: {digest}")
+    print(digest)
+    return 0
@@ -0,0 +1,72 @@
+"""判断当前分支是否应跳过 CI
+
+版本更新分支（bump-version-*）由发布流程自动创建，只改版本号，
+无需再跑完整 CI。对应 ci.yml 中 check-skip-ci job 的逻辑，
+结果通过 GITHUB_OUTPUT 的 should_skip 输出给后续 job。
+"""
+
+import os
+import subprocess
+
+from utils.logger import log_error, log_info, log_success
+
+
+def _get_current_branch() -> str:
+    """读取当前 git 分支名"""
+    result = subprocess.run(
+        ["git", "branch", "--show-current"], capture_output=True, text=True
+    )
+    return result.stdout.strip()
+
+
+def _output_github_actions(should_skip: bool, branch: str) -> None:
+    """把判定结果写入 GITHUB_OUTPUT（本地运行时跳过）"""
+    output_file = os.environ.get("GITHUB_OUTPUT")
+    if not output_file:
+        return
+    # 拼好整段内容后单次 write，避免多次系统调用，
+    # 也防止并行 job 追加写入时两行之间被交错
+    payload = f"should_skip={'true' if should_skip else 'false'}\nbranch={branch}\n"
+    with open(output_file, "a", encoding="utf-8") as f:
+        f.write(payload)
+
+
+def _validate_pr_creator(args) -> bool:
+    """校验 bump-version-* 分支的 PR 是否由授权用户（CI 机器人）创建"""
+    pr_creator = args.pr_creator or os.environ.get("PR_CREATOR", "")
+    expected = os.environ.get("WORKFLOW_USER_NAME", "")
+    log_info(f"PR 创建者: {pr_creator or 'unknown'}")
+    log_info(f"期望用户: {expected}")
+    return pr_creator == expected
+
+
+def check_skip(args) -> int:
+    """check-skip 子命令入口"""
+    branch = (
+        os.environ.get("GITHUB_HEAD_REF")
+        or os.environ.get("GITHUB_REF_NAME")
+        or _get_current_branch()
+    )
+
+    log_info(f"检查分支: {branch}")
+
+    # 常见路径（普通分支）只做一次前缀判断就收工，
+    # 事件类型和授权用户相关的环境变量留到真正需要时再读
+    if not branch.startswith("bump-version-"):
+        log_info("非版本更新分支，CI 正常运行")
+        _output_github_actions(False, branch)
+        return 0
+
+    log_success(f"检测到版本更新分支: {branch}")
+
+    # 只有 PR 事件才需要校验分支创建者
+    event_name = args.event_name or os.environ.get("GITHUB_EVENT_NAME", "")
+    log_info(f"事件类型: {event_name or '(未知)'}")
+    if event_name == "pull_request" and not _validate_pr_creator(args):
+        log_error("bump-version-* 分支只能由授权用户创建")
+        _output_github_actions(False, branch)
+        return 1
+
+    log_success("should_skip=true（版本更新分支）")
+    _output_github_actions(True, branch)
+    return 0
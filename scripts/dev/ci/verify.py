@@ -0,0 +1,78 @@
+"""汇总各 CI job 的结果并判定整体状态
+
+从环境变量读取每个 job 的结果（如 CHECK_LINT_RESULT、TESTS_RESULT），
+任一 job 失败或被取消则整体判定为失败，对应 ci.yml 中
+check-status job 的逻辑。
+"""
+
+import os
+from enum import Enum
+from typing import List
+
+from utils.logger import log_error, log_info, log_success, log_warning
+
+
+class JobResult(Enum):
+    """单个 CI job 的结果"""
+
+    SUCCESS = "success"
+    FAILURE = "failure"
+    CANCELLED = "cancelled"
+    SKIPPED = "skipped"
+    UNKNOWN = "unknown"
+
+    @classmethod
+    def from_str(cls, value: str) -> "JobResult":
+        """从 GitHub Actions 的 result 字符串解析"""
+        return _RESULT_MAP.get(value.lower(), cls.UNKNOWN)
+
+
+# 字符串到枚举的查表，替代 from_str 里逐个比较的 if/elif 链
+_RESULT_MAP = {
+    "success": JobResult.SUCCESS,
+    "failure": JobResult.FAILURE,
+    "cancelled": JobResult.CANCELLED,
+    "skipped": JobResult.SKIPPED,
+}
+
+
+# 默认需要检查的 job（与 ci.yml 中 check-status 的 needs 对应）
+DEFAULT_JOBS = ["check-lint", "tests"]
+
+
+def _env_name(job: str) -> str:
+    """job 名称到环境变量名: 大写、'-' 换 '_'，加 _RESULT 后缀
+
+    如 check-lint -> CHECK_LINT_RESULT。
+    """
+    return f"{job.upper().replace('-', '_')}_RESULT"
+
+
+def _get_job_result(job: str, env: dict) -> JobResult:
+    """从环境快照读取指定 job 的结果"""
+    return JobResult.from_str(env.get(_env_name(job), ""))
+
+
+def verify(args) -> int:
+    """verify 子命令入口"""
+    jobs: List[str] = args.jobs or DEFAULT_JOBS
+
+    # os.environ 的每次 get 都要做一轮 encode/decode，
+    # 循环前整体快照成普通 dict，后续查询就是纯字典访问
+    env = dict(os.environ)
+
+    failed = []
+    for job in jobs:
+        result = _get_job_result(job, env)
+        log_info(f"{job}: {result.value}")
+        if result in (JobResult.FAILURE, JobResult.CANCELLED):
+            failed.append(job)
+        elif result is JobResult.UNKNOWN:
+            log_warning(f"job {job} 的结果未知（可能未运行）")
+
+    if failed:
+        log_error(f"以下 job 未通过: {', '.join(failed)}")
+        return 1
+
+    log_success("所有 job 检查通过")
+    return 0
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+开发辅助脚本入口
+
+按子命令惰性构建解析器并导入对应模块：先用一个极简的
+ArgumentParser 只解析顶层命令名，再由 build_<cmd>_parser 只注册
+被选中命令的子解析器，命令实现模块在执行时才导入。每次调用的
+冷启动成本只与当前命令成正比，CI 中每个 job 都会调用本脚本，
+累计节省可观。
+
+使用方法:
+    python3 scripts/dev/dev.py <command> [options]
+
+可用命令:
+    check-skip        判断当前分支是否跳过 CI
+    verify            汇总各 CI job 结果并判定整体状态
+    pr-merge          合并指定的 Pull Request
+    homebrew-update   更新 Homebrew Formula 的版本与校验和
+    homebrew-create   从模板生成 Homebrew Formula
+    checksum          计算文件的 SHA-256 校验和
+"""
+
+import argparse
+import sys
+
+
+def build_check_skip_parser(subparsers) -> None:
+    parser = subparsers.add_parser("check-skip", help="判断当前分支是否跳过 CI")
+    parser.add_argument("--event-name", default="", help="GitHub 事件名称（默认读环境变量）")
+    parser.add_argument("--pr-creator", default="", help="PR 创建者（默认读环境变量）")
+
+    def run(args) -> int:
+        from ci.check_skip import check_skip
+
+        return check_skip(args)
+
+    parser.set_defaults(func=run)
+
+
+def build_verify_parser(subparsers) -> None:
+    parser = subparsers.add_parser("verify", help="汇总各 CI job 结果并判定整体状态")
+    parser.add_argument("--jobs", nargs="*", default=None, help="需要检查的 job 名称列表")
+
+    def run(args) -> int:
+        from ci.verify import verify
+
+        return verify(args)
+
+    parser.set_defaults(func=run)
+
+
+def build_pr_merge_parser(subparsers) -> None:
+    parser = subparsers.add_parser("pr-merge", help="合并指定的 Pull Request")
+    parser.add_argument("--pr-number", type=int, required=True, help="PR 编号")
+    parser.add_argument(
+        "--method",
+        choices=["merge", "squash", "rebase"],
+        default="squash",
+        help="合并方式（默认 squash）",
+    )
+    parser.add_argument("--delete-branch", action="store_true", help="合并后删除分支")
+
+    def run(args) -> int:
+        from pr.merge import merge
+
+        return merge(args)
+
+    parser.set_defaults(func=run)
+
+
+def build_homebrew_update_parser(subparsers) -> None:
+    parser = subparsers.add_parser(
+        "homebrew-update", help="更新 Homebrew Formula 的版本与校验和"
+    )
+    parser.add_argument("--version", required=True, help="发布版本号（不含 v 前缀）")
+    parser.add_argument("--archive", required=True, help="release 压缩包路径")
+    parser.add_argument("--formula", required=True, help="Formula 文件路径")
+    parser.add_argument(
+        "--template", default="homebrew/Formula.template", help="Formula 模板路径"
+    )
+    parser.add_argument("--push", action="store_true", help="提交后推送到远程")
+
+    def run(args) -> int:
+        from homebrew.update import update
+
+        return update(args)
+
+    parser.set_defaults(func=run)
+
+
+def build_homebrew_create_parser(subparsers) -> None:
+    parser = subparsers.add_parser("homebrew-create", help="从模板生成 Homebrew Formula")
+    parser.add_argument("--version", required=True, help="版本号（用于 version 字段）")
+    parser.add_argument("--formula", required=True, help="Formula 输出路径")
+    parser.add_argument(
+        "--template", default="homebrew/Formula.template", help="Formula 模板路径"
+    )
+    parser.add_argument(
+        "--install-type", choices=["tag", "branch"], default="tag", help="安装类型"
+    )
+    parser.add_argument("--version-ref", required=True, help="tag 名称或 branch 名称")
+
+    def run(args) -> int:
+        from homebrew.create import create
+
+        return create(args)
+
+    parser.set_defaults(func=run)
+
+
+def build_checksum_parser(subparsers) -> None:
+    parser = subparsers.add_parser("checksum", help="计算文件的 SHA-256 校验和")
+    parser.add_argument("file", help="目标文件路径")
+
+    def run(args) -> int:
+        from checksum.calculate import run as calculate_run
+
+        return calculate_run(args)
+
+    parser.set_defaults(func=run)
+
+
+# 命令名 -> 子解析器构建函数；实现模块在 run 时才导入
+_PARSER_BUILDERS = {
+    "check-skip": build_check_skip_parser,
+    "verify": build_verify_parser,
+    "pr-merge": build_pr_merge_parser,
+    "homebrew-update": build_homebrew_update_parser,
+    "homebrew-create": build_homebrew_create_parser,
+    "checksum": build_checksum_parser,
+}
+
+
+def main() -> int:
+    # 第一阶段：极简解析器只取顶层命令名，不构建任何子解析器
+    bootstrap = argparse.ArgumentParser(add_help=False)
+    bootstrap.add_argument("command", nargs="?")
+    known, _ = bootstrap.parse_known_args()
+
+    if known.command in (None, "-h", "--help"):
+        print(__doc__)
+        return 0
+
+    builder = _PARSER_BUILDERS.get(known.command)
+    if builder is None:
+        from utils.logger import log_error
+
+        log_error(f"未知命令: {known.command}")
+        print(__doc__)
+        return 1
+
+    # 第二阶段：只为被选中的命令构建子解析器，再解析完整参数
+    parser = argparse.ArgumentParser(prog="dev.py")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    builder(subparsers)
+    args = parser.parse_args()
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
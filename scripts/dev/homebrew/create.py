@@ -0,0 +1,55 @@
+"""从模板生成 Homebrew Formula（首次创建）
+
+读取 homebrew/Formula.template，替换 {{VERSION}}、{{INSTALL_TYPE}}、
+{{VERSION_REF}} 与 {{URL_LINE}} 占位符后写出 Formula 文件，
+结果通过 GITHUB_OUTPUT 反馈给后续 CI 步骤。
+"""
+
+import os
+from pathlib import Path
+
+from utils.logger import log_error, log_success
+
+
+def _output_ci_result(success: bool, formula_path: str) -> None:
+    """把生成结果写入 GITHUB_OUTPUT（本地运行时跳过）"""
+    output_file = os.environ.get("GITHUB_OUTPUT")
+    if not output_file:
+        return
+    # 先拼好整段内容，一次 write 写入：GITHUB_OUTPUT 以追加模式打开，
+    # 单次写也避免并行步骤交错写入时行被拆开
+    payload = (
+        f"formula_created={'true' if success else 'false'}\n"
+        f"formula_path={formula_path}\n"
+    )
+    with open(output_file, "a", encoding="utf-8") as f:
+        f.write(payload)
+
+
+def create(args) -> int:
+    """homebrew-create 子命令入口"""
+    template_path = Path(args.template)
+    formula_path = Path(args.formula)
+
+    if not template_path.exists():
+        log_error(f"模板文件不存在: {template_path}")
+        _output_ci_result(False, str(formula_path))
+        return 1
+
+    content = template_path.read_text(encoding="utf-8")
+    content = content.replace("{{VERSION}}", args.version)
+    content = content.replace("{{INSTALL_TYPE}}", args.install_type)
+    content = content.replace("{{VERSION_REF}}", args.version_ref)
+
+    # 根据安装类型生成 url 行（tag 或 branch 引用）
+    if args.install_type == "tag":
+        url_line = f'url "https://github.com/zevwings/workflow.rs.git", tag: "{args.version_ref}"'
+    else:
+        url_line = f'url "https://github.com/zevwings/workflow.rs.git", branch: "{args.version_ref}"'
+    content = content.replace("{{URL_LINE}}", url_line)
+
+    formula_path.parent.mkdir(parents=True, exist_ok=True)
+    formula_path.write_text(content, encoding="utf-8")
+    log_success(f"Formula 已生成: {formula_path}")
+    _output_ci_result(True, str(formula_path))
+    return 0
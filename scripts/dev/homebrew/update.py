@@ -0,0 +1,207 @@
+"""更新 Homebrew Formula 的版本、下载地址与校验和
+
+发布新版本后，计算 release 压缩包的 SHA-256，更新（或从
+homebrew/Formula.template 生成）Formula 文件，并可选地提交推送
+到 homebrew-workflow 仓库。对应 release.yml 中
+update-homebrew job 的逻辑。
+"""
+
+import functools
+import os
+import re
+import shlex
+import shutil
+import subprocess
+from pathlib import Path
+
+from checksum.calculate import calculate
+from utils.logger import log_error, log_info, log_success, log_warning
+
+@functools.lru_cache(maxsize=8)
+def _formula_regex(repo: str) -> "re.Pattern[str]":
+    """version/url/sha256 三个字段合并成一条交替模式
+
+    一次 sub 扫完整个文件，替换回调按命中的分组分派；
+    url 分支依赖 owner/repo，所以整条模式按仓库缓存。
+    """
+    return re.compile(
+        r'(version\s+"[^"]+")'
+        r'|(url\s+"https://github\.com/'
+        + re.escape(repo)
+        + r'/releases/download/[^"]+")'
+        r'|(sha256\s+"[^"]+")'
+    )
+
+
+def run_git_command(args, check=True):
+    """执行 git 命令并返回 stdout"""
+    result = subprocess.run(["git", *args], capture_output=True, text=True)
+    if check and result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} 失败: {result.stderr.strip()}")
+    return result.stdout.strip()
+
+
+def _fast_run_git(args) -> "tuple[int, str]":
+    """用 posix_spawnp 执行只读 git 查询，返回 (退出码, stdout)
+
+    subprocess.run 在拼装 Popen 对象上有不少 Python 层开销；
+    只读查询不需要这些，直接 posix_spawn + 管道读取即可。
+    """
+    read_fd, write_fd = os.pipe()
+    pid = os.posix_spawnp(
+        "git",
+        ["git", *args],
+        os.environ,
+        file_actions=[
+            (os.POSIX_SPAWN_DUP2, write_fd, 1),
+            (os.POSIX_SPAWN_CLOSE, read_fd),
+        ],
+    )
+    os.close(write_fd)
+    with open(read_fd, "rb") as stdout:
+        output = stdout.read()
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), output.decode("utf-8").strip()
+
+
+# https 与 ssh 两种远程地址格式，一条模式同时捕获 owner 和 repo
+_REMOTE_RE = re.compile(
+    r"(?:https://github\.com/|git@github\.com:)([^/]+)/([^/]+?)(?:\.git)?/?$"
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_repo() -> str:
+    """从 origin 远程地址解析出 owner/repo
+
+    一次运行里 origin 不会变，缓存结果避免重复启动 git 子进程。
+    """
+    url = run_git_command(["remote", "get-url", "origin"])
+    m = _REMOTE_RE.match(url)
+    if m:
+        return f"{m[1]}/{m[2]}"
+    raise RuntimeError(f"无法从远程地址解析 owner/repo: {url}")
+
+
+def _update_existing_file(formula_path: Path, version: str, url: str, sha256: str) -> str:
+    """更新已有 Formula 的 version/url/sha256 字段，返回最终内容"""
+    content = formula_path.read_text(encoding="utf-8")
+    repo = _get_repo()
+
+    # 分组序号与 _formula_regex 中的交替顺序一一对应
+    replacements = (f'version "{version}"', f'url "{url}"', f'sha256 "{sha256}"')
+    content = _formula_regex(repo).sub(
+        lambda m: replacements[m.lastindex - 1], content
+    )
+    # 写入新文件再原子替换：原地截断会连同 .bak 硬链接一起改掉
+    tmp_path = formula_path.with_suffix(formula_path.suffix + ".tmp")
+    tmp_path.write_text(content, encoding="utf-8")
+    os.replace(tmp_path, formula_path)
+    return content
+
+
+def _generate_from_template(
+    template_path: Path, formula_path: Path, version: str, url: str, sha256: str
+) -> str:
+    """从模板生成 Formula 文件，返回最终内容"""
+    content = template_path.read_text(encoding="utf-8")
+    content = content.replace("{{VERSION}}", version)
+    content = content.replace("{{URL_LINE}}", f'url "{url}"\n    sha256 "{sha256}"')
+    formula_path.parent.mkdir(parents=True, exist_ok=True)
+    formula_path.write_text(content, encoding="utf-8")
+    return content
+
+
+def _run_git_batch(commands) -> None:
+    """把一串 git 命令拼成单条 shell 脚本，只启动一个子进程
+
+    每个 subprocess.run 都要 fork + exec 一次，CI 容器里开销可观；
+    用 && 串联后整批只付一次进程启动成本，任一步失败即中断。
+    """
+    script = " && ".join(
+        " ".join(shlex.quote(part) for part in ["git", *args]) for args in commands
+    )
+    subprocess.run(script, shell=True, executable="/bin/bash", check=True)
+
+
+def _git_operations(formula_path: Path, version: str, push: bool) -> None:
+    """提交并推送 Formula 变更"""
+    _run_git_batch(
+        [
+            ["config", "user.name", "github-actions[bot]"],
+            ["config", "user.email", "github-actions[bot]@users.noreply.github.com"],
+            ["add", str(formula_path)],
+        ]
+    )
+
+    # 暂存区没有变化时跳过提交
+    returncode, _ = _fast_run_git(["diff", "--staged", "--quiet"])
+    if returncode == 0:
+        log_info("Formula 无变化，跳过提交")
+        return
+
+    # 直接运行 audit：brew 不存在时 exec 会抛 FileNotFoundError，
+    # 不必为探测多付一次 brew 启动（brew 本身冷启动要数百毫秒）
+    try:
+        audit = subprocess.run(
+            ["brew", "audit", "--strict", str(formula_path)],
+            capture_output=True,
+            text=True,
+        )
+    except FileNotFoundError:
+        log_info("未检测到 brew，跳过 audit")
+    else:
+        if audit.returncode != 0:
+            log_warning(f"brew audit 报告问题:\n{audit.stdout}")
+
+    commands = [["commit", "-m", f"chore: update formula to v{version}"]]
+    branch = None
+    if push:
+        _, branch = _fast_run_git(["branch", "--show-current"])
+        commands.append(["push", "origin", branch])
+    _run_git_batch(commands)
+    if branch is not None:
+        log_success(f"已推送到 {branch}")
+
+
+def update(args) -> int:
+    """homebrew-update 子命令入口"""
+    formula_path = Path(args.formula)
+    archive_path = Path(args.archive)
+    if not archive_path.exists():
+        log_error(f"发布包不存在: {archive_path}")
+        return 1
+
+    # 计算发布包的校验和
+    log_info(f"计算 {archive_path.name} 的 SHA-256 ...")
+    sha256 = calculate(str(archive_path))
+    log_info(f"SHA-256: {sha256}")
+
+    repo = _get_repo()
+    url = f"https://github.com/{repo}/releases/download/v{args.version}/{archive_path.name}"
+
+    if formula_path.exists():
+        # 修改前备份一份，便于失败时人工回滚。优先硬链接：不复制
+        # 数据块，常数时间完成；跨文件系统或已存在时回退到复制
+        backup_path = formula_path.with_suffix(formula_path.suffix + ".bak")
+        try:
+            backup_path.unlink(missing_ok=True)
+            os.link(formula_path, backup_path)
+        except OSError:
+            shutil.copy(formula_path, backup_path)
+        content = _update_existing_file(formula_path, args.version, url, sha256)
+    else:
+        template_path = Path(args.template)
+        if not template_path.exists():
+            log_error(f"模板文件不存在: {template_path}")
+            return 1
+        content = _generate_from_template(
+            template_path, formula_path, args.version, url, sha256
+        )
+
+    # 回显最终内容，便于在 CI 日志中核对（写入函数已返回，无需重读文件）
+    log_info(f"更新后的 Formula:\n{content}")
+
+    _git_operations(formula_path, args.version, args.push)
+    log_success(f"Formula 已更新到 v{args.version}")
+    return 0
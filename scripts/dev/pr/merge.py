@@ -0,0 +1,26 @@
+"""合并指定的 Pull Request
+
+gh CLI 的薄封装，供发布流程在 CI 中合并自动创建的
+版本更新 PR 使用。
+"""
+
+import subprocess
+
+from utils.logger import log_error, log_info, log_success
+
+
+def merge(args) -> int:
+    """pr-merge 子命令入口"""
+    log_info(f"合并 PR #{args.pr_number}（{args.method}）")
+
+    cmd = ["gh", "pr", "merge", str(args.pr_number), f"--{args.method}"]
+    if args.delete_branch:
+        cmd.append("--delete-branch")
+
+    result = subprocess.run(cmd)
+    if result.returncode != 0:
+        log_error(f"合并 PR #{args.pr_number} 失败")
+        return 1
+
+    log_success(f"PR #{args.pr_number} 已合并")
+    return 0
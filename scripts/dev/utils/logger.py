@@ -0,0 +1,27 @@
+"""统一的日志输出
+
+与仓库内 shell 脚本（scripts/install.sh）的输出风格保持一致，
+使用 emoji 前缀标记日志级别。
+"""
+
+import sys
+
+
+def log_info(message: str) -> None:
+    """输出提示信息"""
+    print(f"ℹ️  {message}")
+
+
+def log_success(message: str) -> None:
+    """输出成功信息"""
+    print(f"✅ {message}")
+
+
+def log_warning(message: str) -> None:
+    """输出警告信息"""
+    print(f"⚠️  {message}")
+
+
+def log_error(message: str) -> None:
+    """输出错误信息（写到 stderr）"""
+    print(f"❌ {message}", file=sys.stderr)